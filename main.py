@@ -15,15 +15,17 @@
 # understand and extend.
 
 
+import os
 import re
+import threading
 import time
 import random
-import os
-import sys
 
-# Ensure custom modules in the same directory can be imported when running the script
-sys.path.insert(0, os.path.dirname(__file__))
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from itertools import cycle
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -32,31 +34,51 @@ from textual.binding import Binding
 from textual.containers import Container, Vertical
 from textual.message import Message
 from textual.reactive import reactive
-from textual import events
+from textual.timer import Timer
+from textual import events, work
 from textual.widgets import (
     Input,
     Static,
     TextArea,
     TabbedContent,
     TabPane,
+    Tabs,
     OptionList,
     Button,
 )
 from textual.widgets._text_area import Selection
 from textual.widgets.option_list import Option
 from rich.text import Text
+
+# ``orjson`` is an optional C-extension JSON codec that is considerably
+# faster than the standard library and produces bytes directly. Fall back to
+# ``json`` when it isn't installed so the app keeps working without extra
+# dependencies.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    import json as _json
+
+    def _json_dumps(data: object) -> bytes:
+        # Compact separators match orjson's output: fewer bytes to write.
+        return _json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = _json.loads
     
 
 
 # Initial note files stored on disk. ``Path`` works across operating systems
-# and makes future modifications easy. These are loaded on startup.
+# and makes future modifications easy. These are loaded on startup. The
+# directory itself is created in ``NoteApp.__init__`` so merely importing
+# this module performs no filesystem I/O.
 DATA_DIR = Path("data")
-DATA_DIR.mkdir(exist_ok=True)
 
-INITIAL_FILES = {
-    "tab1": DATA_DIR / "notes1.txt",
-    "tab2": DATA_DIR / "notes2.txt",
-}
+# Plain strings here; the ``Path`` objects are only built when the app
+# actually loads the files, keeping import side effects minimal.
+INITIAL_FILES: tuple[tuple[str, str], ...] = (
+    ("tab1", "notes1.txt"),
+    ("tab2", "notes2.txt"),
+)
 
 # Base title shown in the window. An asterisk is added when notes are modified
 # to provide a quick visual cue about unsaved work.
@@ -71,33 +93,15 @@ TAB_STATE_FILE = DATA_DIR / "tabs_state.json"
 # easily be changed later if desired.
 QUOTES_FILE = DATA_DIR / "quotes.txt"
 
-# Lines shown in sequence when attempting to delete a note.
-HAIKU_LINES = [
-    "Hvad vil du fortrænge?\nHvad hvis det var begyndelse –\nikke en fejlskrift?",
-    "Du trykker for slet.\nMen hvem var du, da du skrev?\nEr han stadig her?",
-    "Hver linje du skrev\nbar en drøm i forklædning.\nEr du træt af den?",
-    "Hvis du nu forlod\ndette fragment af din stemme –\nhvem vil finde den?",
-    "Glemsel er let nok,\nmen har du givet mening\ntil det, du vil fjerne?",
-    "Skriv ikke forbi.\nSkriv en grav for ordene –\nog gå den i møde.",
-    "Den tavse cursor spør’:\nSkal jeg fortsætte alene?\nEller med din hånd?",
-    "Et klik, og det går –\nmen før du lader det ske,\nsig hvad det var værd.",
-    "Afsked uden ord\ner bare fortrængningens dans.\nGiv det rytme først.",
-    "Du skrev det i hast –\nvil du også slette det\nsådan? Eller i haiku?",
-    "Måske var det grimt.\nMen var det ikke også dig?\nÉn dag i dit liv.",
-    "Dette var engang\net sted du tænkte frit i.\nGår du nu forbi?",
-    "Du trykker på slet.\nMen vil du virkelig forlade\ndig selv i mørket?",
-    "Lad ikke din frygt\nblive sletterens skygge.\nSkriv med åbne øjne.",
-    "Hvis du kan digte,\nså kan du også forlade –\nmed hjertet åbent.",
-    "Hvad flygter du fra?\nOrdene, du selv har valgt –\neller det, de ser?",
-    "Du skrev dette ned.\nVar det ikke sandt engang?\nHvor blev det af dig?",
-    "Hvis du sletter nu,\nhvem er det så, du forsøger\nat tie ihjel?",
-    "Der var en grund før –\nen tanke, en følelse.\nHar den fortjent glemsel?",
-    "Er du færdig nu?\nEller bare utålmodig\nefter at glemme?",
-    "Du bærer en stemme\nind i mørket, uden spor.\nEr du sikker nu?",
-    "Nogle ord skal væk.\nMen først må du fortælle\nhvad de gjorde ved dig.",
-    "Du har set forbi –\nmen hvad var det, du så her?\nSkriv det i et vers.",
-    "Slet kun det, du har\nmodet til at huske på\nnår tavsheden står.",
-]
+# Plain-string versions of the paths polled repeatedly at runtime; passing a
+# string to ``os.stat``/``os.path.exists`` skips the Path machinery per call.
+_QUOTES_FILE_STR = str(QUOTES_FILE)
+_TAB_STATE_FILE_STR = str(TAB_STATE_FILE)
+
+# File with the lines shown in sequence when attempting to delete a note.
+# Entries are separated by ``---`` lines and only read the first time the
+# delete prompt is actually opened, keeping them off the import path.
+HAIKU_FILE = DATA_DIR / "haiku.txt"
 
 # Words highlighted in Ordforsagelse mode when repeated
 FILLER_WORDS = {
@@ -134,9 +138,38 @@ PAUSE_QUESTIONS = [
 ]
 
 
+# Shortcuts stripped from the built-in widgets so they can be handled (or
+# ignored) by the application itself. Exact key equality is used rather than
+# substring matching, which would also have caught keys such as
+# ``ctrl+home`` that merely contain ``ctrl+h``.
+_BANNED_KEYS = frozenset(
+    {"ctrl+h", "ctrl+k", "ctrl+m", "ctrl+w", "ctrl+delete"}
+)
+
+
+def _strip_banned_bindings(bindings):
+    # Shared filter for widget BINDINGS lists; runs once per class body.
+    return [b for b in bindings if b.key not in _BANNED_KEYS]
+
+# Keys swallowed outright on the key-event hot path. Kept as a module-level
+# frozenset so no set object is rebuilt on every keypress.
+_SWALLOWED_KEYS = frozenset({"ctrl+h", "ctrl+k", "ctrl+m", "ctrl+w"})
+
+# Keys Hemingway mode blocks so the writer cannot delete or backtrack.
+_HEMINGWAY_BLOCKED = frozenset({"backspace", "delete", "left"})
+
+# Preformatted ``mm:ss`` labels covering the preset range (up to 11 minutes),
+# so the common tick path is a tuple index instead of divmod plus formatting.
+_MMSS = tuple(f"T {i // 60:02d}:{i % 60:02d}" for i in range(661))
+
+
+@lru_cache(maxsize=64)
 def parse_time_spec(value: str) -> Optional[int]:
     # Convert a textual time specification to seconds.
     #
+    # The function is pure, so repeated submissions of common values such as
+    # ``"2m"`` or ``"90"`` are answered from a small memo cache.
+    #
     # The value may be a plain number, meaning seconds, or it can end with
     # ``m`` to indicate minutes (for example ``"2m"`` is two minutes).  Any
     # whitespace around the value is ignored.  If parsing fails the function
@@ -144,23 +177,57 @@ def parse_time_spec(value: str) -> Optional[int]:
     #
     # ``value`` -- the text provided by the user.
 
-    match = re.fullmatch(r"(\d+)(m?)", value.strip().lower())
-    if not match:
+    # The grammar (digits plus optional ``m``) is simple enough that a
+    # direct parse beats dispatching into the regex engine.
+    spec = value.strip().lower()
+    multiplier = 1
+    if spec.endswith("m"):
+        multiplier = 60
+        spec = spec[:-1]
+    if not spec.isdigit():
         return None
-    amount, minutes = match.groups()
-    seconds = int(amount)
-    if minutes:
-        seconds *= 60
-    return seconds
-
-
-@dataclass
-class CountdownState:
-    # Keep track of the current countdown.
-
-    duration: int = 0  # total duration in seconds
-    remaining: int = 0  # seconds left
-    last_started: float = 0.0  # time when timer was last started
+    return int(spec) * multiplier
+
+
+def _read_note_file(path: Optional[Path]) -> str:
+    # Read a note file for a tab, treating a missing path or any I/O
+    # failure as an empty note.  Reading directly instead of checking
+    # ``exists`` first saves a stat call and avoids racing against the
+    # file disappearing in between.
+    if path is None:
+        return ""
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    # Write ``text`` to ``path`` atomically: encode once, push the bytes to
+    # a temporary file in (normally) a single write, fsync and rename over
+    # the target.  A crash mid-save can never leave a truncated note.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    data = text.encode("utf-8")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+@dataclass(slots=True)
+class TabRecord:
+    # Per-tab bookkeeping held in one record so tab operations hash the
+    # tab id once instead of once per parallel dict.
+
+    path: Optional[Path] = None
+    unsaved: bool = False
+    textarea: Optional["NoteEditor"] = None
+    title: str = ""
 
 
 @dataclass
@@ -185,10 +252,22 @@ class WritingModes:
 class TimerDisplay(Static):
     # Widget that shows the remaining time in ``mm:ss`` format.
 
+    # Last string pushed to the display; duplicate updates are dropped so a
+    # repeated tick with the same visible time doesn't trigger a re-render.
+    _last_text: Optional[str] = None
+
     def update_time(self, seconds: int) -> None:
-        minutes, secs = divmod(max(0, seconds), 60)
-        # Use ASCII only so the timer label renders on bare consoles
-        self.update(f"T {minutes:02d}:{secs:02d}")
+        seconds = max(0, seconds)
+        if seconds < len(_MMSS):
+            text = _MMSS[seconds]
+        else:
+            minutes, secs = divmod(seconds, 60)
+            # Use ASCII only so the timer label renders on bare consoles
+            text = f"T {minutes:02d}:{secs:02d}"
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self.update(text)
 
 
 class NoteInput(Input):
@@ -198,36 +277,15 @@ class NoteInput(Input):
     # Ctrl+M. These shortcuts are removed so they can't trigger Textual's
     # built-in commands and will instead be handled (or ignored) by the
     # application itself.
-    BINDINGS = [
-        b
-        for b in Input.BINDINGS
-        if (
-            "ctrl+h" not in b.key
-            and "ctrl+k" not in b.key
-            and "ctrl+m" not in b.key
-            and "ctrl+w" not in b.key
-            and "ctrl+delete" not in b.key
-        )
-    ]
+    BINDINGS = _strip_banned_bindings(Input.BINDINGS)
 
 
 class NoteEditor(TextArea):
     """Text area used for editing notes."""
 
-    BINDINGS = [
-        b
-        for b in TextArea.BINDINGS
-        if (
-            "ctrl+h" not in b.key
-            and "ctrl+k" not in b.key
-            and "ctrl+m" not in b.key
-            and "ctrl+w" not in b.key
-            and "ctrl+delete" not in b.key
-        )
-    ] + [
+    BINDINGS = _strip_banned_bindings(TextArea.BINDINGS) + [
         ("f5", "toggle_mark", "Start/stop markering"),
         ("ctrl+space", "toggle_mark", "Start/stop markering"),
-
     ]
 
 
@@ -286,7 +344,7 @@ class NoteEditor(TextArea):
             self.screen.clear_selection()
 
     async def _on_key(self, event: events.Key) -> None:
-        if event.key in {"ctrl+h", "ctrl+k", "ctrl+m", "ctrl+w"}:
+        if event.key in _SWALLOWED_KEYS:
             event.stop()
             return
         if event.key == "ctrl+delete":
@@ -354,8 +412,8 @@ class TimerOptionList(OptionList):
     def action_cursor_down(self) -> None:
         """Move highlight down or jump to the input when at the end."""
         if self.highlighted == len(self.options) - 1:
-            # Focus the input widget in the parent menu
-            self.parent.query_one(NoteInput).focus()
+            # Focus the input widget cached by the parent menu
+            self.parent._custom_input.focus()
         else:
             super().action_cursor_down()
 
@@ -372,6 +430,10 @@ class TimerMenu(Vertical):
     # Escape closes the menu. Navigation keys are provided by ``OptionList``.
     BINDINGS = [("escape", "close_menu", "Luk menu")]
 
+    # Preset durations keyed by option id, so selection is a dict lookup
+    # rather than slicing and parsing the id on every press.
+    _PRESETS = {"t30": 30, "t180": 180, "t420": 420, "t660": 660}
+
     class SetTime(Message):
         """Message sent when the user selects a duration."""
 
@@ -383,22 +445,27 @@ class TimerMenu(Vertical):
         # ``OptionList`` isn't a container, so the options are passed in via
         # its constructor. Arrow key navigation is handled by the widget
         # automatically. ``TimerOptionList`` is used to jump to the input when
-        # the user presses the down arrow on the last option.
-        yield TimerOptionList(
-            Option("30s", id="t30"),
-            Option("3m", id="t180"),
-            Option("7m", id="t420"),
-            Option("11m", id="t660"),
+        # the user presses the down arrow on the last option. Both children
+        # are kept as attributes so the per-keystroke handlers below don't
+        # have to run a DOM query to find them.
+        self._opt_list = TimerOptionList(
+            *(
+                Option(f"{secs}s" if secs < 60 else f"{secs // 60}m", id=oid)
+                for oid, secs in self._PRESETS.items()
+            ),
             id="timer_options",
         )
-        yield NoteInput(placeholder="Brugerdefineret (f.eks. 90, 2m)", id="custom")
+        yield self._opt_list
+        self._custom_input = NoteInput(
+            placeholder="Brugerdefineret (f.eks. 90, 2m)", id="custom"
+        )
+        yield self._custom_input
 
     def on_mount(self) -> None:
         # Start hidden and focus the option list when the menu appears.
         self.display = False
-        option_list = self.query_one(TimerOptionList)
-        option_list.compact = True
-        option_list.focus()
+        self._opt_list.compact = True
+        self._opt_list.focus()
 
     def show_menu(self) -> None:
         """Fade the menu in and focus the options."""
@@ -406,7 +473,7 @@ class TimerMenu(Vertical):
         self.display = True
         self.styles.opacity = 0
         self.styles.animate("opacity", 1.0, duration=0.2)
-        self.query_one(TimerOptionList).focus()
+        self._opt_list.focus()
 
     def hide_menu(self) -> None:
         """Fade the menu out and hide it when done."""
@@ -425,8 +492,7 @@ class TimerMenu(Vertical):
     ) -> None:
         """Handle selection from the preset list."""
 
-        seconds = int(event.option.id[1:])
-        self.post_message(self.SetTime(seconds))
+        self.post_message(self.SetTime(self._PRESETS[event.option.id]))
 
     def on_input_submitted(self, event: Input.Submitted) -> None:  # type: ignore[override]
         # Parse custom duration and send ``SetTime`` if valid.
@@ -442,12 +508,12 @@ class TimerMenu(Vertical):
         """Handle keys within the timer menu."""
 
         # When the custom input has focus and the user presses the up arrow,
-        # move focus back to the preset options so the user isn't trapped in the
-        # input field.
-        if self.query_one(NoteInput).has_focus and event.key == "up":
-            option_list = self.query_one(TimerOptionList)
-            option_list.highlighted = len(option_list.options) - 1
-            option_list.focus()
+        # move focus back to the preset options so the user isn't trapped in
+        # the input field. Checking the key first and comparing identity with
+        # the app's focused widget keeps this path branch-cheap per keypress.
+        if event.key == "up" and self.app.focused is self._custom_input:
+            self._opt_list.highlighted = len(self._opt_list.options) - 1
+            self._opt_list.focus()
             event.stop()
 
 
@@ -477,10 +543,22 @@ class FileOpenMenu(Vertical):
 
     def refresh_files(self) -> None:
         """Load ``.txt`` files from ``DATA_DIR`` into the list."""
+        # ``os.scandir`` skips glob's fnmatch machinery and per-entry Path
+        # objects; sorting the name strings directly is also cheaper than
+        # comparing Paths. Adding all options in one call means the list
+        # only re-renders once no matter how many notes exist. File names
+        # are shown without the extension for a cleaner look.
+        entries = []
+        with os.scandir(DATA_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".txt") and entry.is_file():
+                    entries.append((name, entry.path))
+        entries.sort()
         self.file_list.clear_options()
-        for path in sorted(DATA_DIR.glob("*.txt")):
-            # Show the file name without extension for a cleaner look
-            self.file_list.add_option(Option(path.stem, id=str(path)))
+        self.file_list.add_options(
+            [Option(name[:-4], id=path) for name, path in entries]
+        )
 
     def action_close_menu(self) -> None:
         # Hide the menu without opening a file
@@ -504,11 +582,13 @@ class SaveAsMenu(Vertical):
             self.path = path
 
     def compose(self) -> ComposeResult:
-        yield NoteInput(placeholder="Filnavn", id="save_as_path")
+        # Keep a reference so callers don't need a DOM query to reach it.
+        self._input = NoteInput(placeholder="Filnavn", id="save_as_path")
+        yield self._input
 
     def on_mount(self) -> None:
         # Focus the input so the user can type immediately
-        self.query_one(NoteInput).focus()
+        self._input.focus()
 
     def action_close_menu(self) -> None:
         # Close the menu without saving
@@ -529,24 +609,47 @@ class NotificationBar:
         self.app = app
         # Timer used to restore the previous status message
         self._restore_timer = None
+        # Status content to bring back once the notification times out
+        self._base = None
+        # Latest message of the current burst plus a flag so one deferred
+        # flush serves any number of same-frame show() calls.
+        self._pending = None
+        self._flush_scheduled = False
 
     def show(self, message: str, duration: float = 2.0) -> None:
         """Display ``message`` in the status line for ``duration`` seconds."""
 
-        # Cancel any existing timer so the previous message does not flash back
         if self._restore_timer is not None:
+            # A notification is already showing; reuse its captured base
+            # content so overlapping messages collapse into one restore step
+            # instead of chaining timers that flash stale notifications back.
             self._restore_timer.stop()
-
-        # ``Static`` widgets store the current content in ``renderable``.
-        # Capture that value so it can be restored after the timeout.
-        previous = self.app.status.renderable
-
-        self.app.status.update(message)
-
-        def restore() -> None:
-            self.app.status.update(previous)
-
-        self._restore_timer = self.app.set_timer(duration, restore)
+        else:
+            # ``Static`` widgets expose the current content via ``content``.
+            # Capture that value so it can be restored after the timeout.
+            self._base = self.app.status.content
+
+        # Defer the widget update: a burst of notifications (save + close
+        # + toggle in one event) then costs a single render, showing only
+        # the last message.  ``call_next`` runs the flush on the next
+        # message-loop pass; a zero-delay timer would never fire.
+        self._pending = message
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.app.call_next(self._flush)
+        self._restore_timer = self.app.set_timer(duration, self._restore)
+
+    def _flush(self) -> None:
+        # Write the most recent message of the burst to the status line.
+        self._flush_scheduled = False
+        if self._pending is not None:
+            self.app.status.update(self._pending)
+            self._pending = None
+
+    def _restore(self) -> None:
+        # Bring back the status content from before the notification burst.
+        self.app.status.update(self._base)
+        self._restore_timer = None
 
 
 class QuoteOverlay(Vertical):
@@ -646,6 +749,10 @@ class QuoteOverlay(Vertical):
             self.action_close()
 
 
+# Fixed introduction shown above the rotating haiku line.
+_HAIKU_PREFIX = "Denne maskine er skabt for at skrive, ikke slette.\n\n"
+
+
 class HaikuPrompt(Vertical):
     """Modal shown to confirm deletion with a haiku."""
 
@@ -657,12 +764,45 @@ class HaikuPrompt(Vertical):
         def __init__(self) -> None:
             super().__init__()
 
-    def __init__(self, lines: list[str], **kwargs) -> None:
-        """Store the rotating lines displayed under the heading."""
+    # Map input ids to their slot in the cached word-count list.
+    _LINE_INDEX = {"haiku1": 0, "haiku2": 1, "haiku3": 2}
+
+    # Widgets navigated with the arrow keys on the input step, ordered top to
+    # bottom. ``_focus_idx`` tracks which of them currently has focus so the
+    # key handler is an index jump rather than a chain of has_focus checks.
+    _FOCUS_INDEX = {"haiku1": 0, "haiku2": 1, "haiku3": 2, "haiku_submit": 3}
+
+    # Rotating lines, shared by all prompts and read from ``HAIKU_FILE`` the
+    # first time they are needed rather than at import time.
+    _lines: Optional[list[str]] = None
+
+    def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.lines = lines
-        self.index = 0  # which line to show next
+        self._line_iter = None  # endless iterator over the rotating lines
         self.step = 1  # track whether we're on the accept screen or inputs
+        self._focus_idx = 0  # which input-step widget has focus
+        # Cached word count per line so a keystroke in one input doesn't
+        # force the other two lines to be re-split.
+        self._wc = [0, 0, 0]
+
+    @property
+    def lines(self) -> list[str]:
+        """The rotating haiku lines, loaded from disk on first access."""
+        if HaikuPrompt._lines is None:
+            # A missing or unreadable haiku file degrades to the fixed
+            # introduction alone rather than crashing the delete prompt.
+            try:
+                raw = HAIKU_FILE.read_text(encoding="utf-8")
+            except OSError:
+                raw = ""
+            # The fixed introduction is baked in here so showing the prompt
+            # doesn't concatenate the same prefix on every rotation.
+            HaikuPrompt._lines = [
+                _HAIKU_PREFIX + part.strip()
+                for part in raw.split("\n---\n")
+                if part.strip()
+            ] or [_HAIKU_PREFIX.strip()]
+        return HaikuPrompt._lines
 
     def compose(self) -> ComposeResult:
         # Heading with the fixed introduction plus a changing line
@@ -698,18 +838,18 @@ class HaikuPrompt(Vertical):
             yield self.cancel_btn
 
     def on_mount(self) -> None:
+        # Start hidden; the rotating line is loaded lazily by ``show_prompt``
+        # so the haiku file is never read unless the prompt is opened.
         self.display = False
         self.visible = False
-        self.load_line()
 
     def load_line(self) -> None:
         """Update the changing line from the rotating list."""
-        text = (
-            "Denne maskine er skabt for at skrive, ikke slette.\n\n"
-            + self.lines[self.index]
-        )
-        self.message.update(text)
-        self.index = (self.index + 1) % len(self.lines)
+        if self._line_iter is None:
+            # The cycle iterator advances in C, replacing the previous
+            # index-and-modulo bookkeeping.
+            self._line_iter = cycle(self.lines)
+        self.message.update(next(self._line_iter))
 
     def show_prompt(self) -> None:
         """Display the modal."""
@@ -759,24 +899,40 @@ class HaikuPrompt(Vertical):
         first and third lines require between three and five words, while the
         second line allows between four and seven. This provides a little
         flexibility so the user isn't forced to match an exact count.
+
+        The word counts are cached in ``self._wc`` and refreshed here from
+        scratch; ``on_input_changed`` keeps individual entries up to date so
+        unchanged lines are not re-split on every keystroke.
         """
 
-        def count_words(text: str) -> int:
-            # Split on whitespace to count words; ignore extra spaces
-            return len(text.strip().split())
+        # ``split()`` with no arguments already collapses whitespace, so no
+        # ``strip()`` is needed before counting.
+        self._wc[0] = len(self.line1.value.split())
+        self._wc[1] = len(self.line2.value.split())
+        self._wc[2] = len(self.line3.value.split())
+        self._check_valid()
 
-        w1 = count_words(self.line1.value)
-        w2 = count_words(self.line2.value)
-        w3 = count_words(self.line3.value)
+    def _check_valid(self) -> None:
+        # Evaluate the cached word counts against the 5-7-5 word ranges.
+        w1, w2, w3 = self._wc
         valid = (
             3 <= w1 <= 5
             and 4 <= w2 <= 7
             and 3 <= w3 <= 5
         )
-        self.submit.disabled = not valid
+        disabled = not valid
+        # Only touch the reactive when the state actually flips; most
+        # keystrokes leave the button as it was.
+        if self.submit.disabled != disabled:
+            self.submit.disabled = disabled
 
     def on_input_changed(self, event: Input.Changed) -> None:  # type: ignore[override]
-        self.validate()
+        # Only recount the line that actually changed.
+        index = self._LINE_INDEX.get(event.input.id)
+        if index is None:
+            return
+        self._wc[index] = len(event.value.split())
+        self._check_valid()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:  # type: ignore[override]
         if not self.submit.disabled:
@@ -806,21 +962,21 @@ class HaikuPrompt(Vertical):
                     self.accept.focus()
                 event.stop()
         elif self.step == 2:
-            # Navigate between the three inputs and the submit button.
-            if event.key == "down":
-                if self.line1.has_focus:
-                    self.line2.focus(); event.stop()
-                elif self.line2.has_focus:
-                    self.line3.focus(); event.stop()
-                elif self.line3.has_focus:
-                    self.submit.focus(); event.stop()
-            elif event.key == "up":
-                if self.submit.has_focus:
-                    self.line3.focus(); event.stop()
-                elif self.line3.has_focus:
-                    self.line2.focus(); event.stop()
-                elif self.line2.has_focus:
-                    self.line1.focus(); event.stop()
+            # Navigate between the three inputs and the submit button using
+            # the focus index maintained by ``on_descendant_focus``.
+            order = (self.line1, self.line2, self.line3, self.submit)
+            if event.key == "down" and self._focus_idx < 3:
+                order[self._focus_idx + 1].focus()
+                event.stop()
+            elif event.key == "up" and self._focus_idx > 0:
+                order[self._focus_idx - 1].focus()
+                event.stop()
+
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        """Remember which input-step widget received focus."""
+        index = self._FOCUS_INDEX.get(event.widget.id)
+        if index is not None:
+            self._focus_idx = index
 
 class ModeMenu(Vertical):
     """Menu allowing toggling of experimental writing modes."""
@@ -891,7 +1047,9 @@ class NoteApp(App[None]):
         ("ctrl+l", "show_quote", "Vis citat"),
     ]
 
-    countdown = reactive(CountdownState())
+    # Seconds left on the countdown; duration and start time are plain
+    # attributes since only the remaining value drives the UI.
+    remaining = reactive(0)
     menu_visible = reactive(False)
     open_menu_visible = reactive(False)
     save_menu_visible = reactive(False)
@@ -904,30 +1062,65 @@ class NoteApp(App[None]):
 
     def __init__(self) -> None:
         super().__init__()
-        # Track unsaved state for each tab individually
-        self.unsaved_map: dict[str, bool] = {}
-        # Map tab id to file path (None for new unsaved files)
-        self.file_map: dict[str, Path | None] = {}
-        # Keep a reference to each NoteEditor widget by tab id so we can
-        # reliably focus them without querying, which may fail before the
-        # widgets are fully mounted.
-        self.textareas: dict[str, NoteEditor] = {}
+        # Make sure the note directory exists before any files are touched.
+        DATA_DIR.mkdir(exist_ok=True)
+        # One record per tab: file path (None for new unsaved files),
+        # unsaved flag and the NoteEditor widget.  Keeping the editor
+        # reference lets us focus it without querying, which may fail
+        # before the widgets are fully mounted.
+        self._tabs: dict[str, TabRecord] = {}
+        # Number of tabs with unsaved changes, kept in sync on every
+        # transition so a global dirty check never rescans the records.
+        self._dirty_count = 0
+        # Ordered tab ids plus a position index so tab navigation is O(1)
+        # instead of rebuilding a list from the records per keypress.
+        self._tab_order: list[str] = []
+        self._tab_index: dict[str, int] = {}
+        # Focus requests are coalesced per refresh so holding a tab
+        # shortcut focuses only the tab the user lands on.
+        self._pending_focus: Optional[str] = None
+        self._focus_scheduled = False
+        # Countdown bookkeeping; only ``remaining`` is reactive.
+        self._duration = 0
+        self._last_started = 0.0
+        self._tick_handle: Optional[Timer] = None
+        # Cached id of the active tab, mirrored on every activation and
+        # programmatic switch so handlers skip the tabs.active property.
+        self._active_tab = "tab1"
         # Counter for generating unique tab ids
         self.tab_counter = 2
         # Track when Ctrl+S was last pressed to support rename on double press
         self._last_save_time = 0.0
         # Store previous text for each tab to track deletions
         self.prev_text: Dict[str, str] = {}
+        # Hash of the text last persisted per tab; lets repeated saves of an
+        # unchanged buffer skip the disk entirely.
+        self._saved_hash: Dict[str, int] = {}
+        # Background saves run on worker threads; the lock serializes the
+        # actual writes and the per-tab sequence lets a newer save of the
+        # same note supersede an older one still waiting to run.
+        self._save_lock = threading.Lock()
+        self._save_seq: Dict[str, int] = {}
         # Current experimental writing modes and their timers
         self.modes = WritingModes()
         # Quote management: list of all quotes and which have been shown
         self.quotes: list[str] = []
         self.shown_quotes: set[str] = set()
+        # Quotes not yet shown; kept in sync so selection avoids a full scan
+        self._available_quotes: set[str] = set()
         self.quotes_finished = False
         # Times when the quote viewer was opened, for rate limiting
         self.quote_request_times: list[float] = []
         # Remember file modification time to detect new quotes
         self._quotes_mtime = 0.0
+        self._last_quote_stat = 0.0
+        # Debounce bookkeeping for tab-state writes: rapid tab churn marks
+        # the state dirty and a single timer flushes it to disk once.
+        self._tab_state_dirty = False
+        self._tab_state_timer = None
+        # Serialized form of the last tab state written to disk; writes are
+        # skipped entirely when the payload hasn't changed.
+        self._last_tab_state_blob: Optional[bytes] = None
 
     def compose(self) -> ComposeResult:
         # Create child widgets.
@@ -947,7 +1140,7 @@ class NoteApp(App[None]):
         self.save_menu = SaveAsMenu(id="save_menu")
         self.save_menu.visible = False
         yield self.save_menu
-        self.haiku_prompt = HaikuPrompt(HAIKU_LINES, id="haiku_overlay")
+        self.haiku_prompt = HaikuPrompt(id="haiku_overlay")
         self.haiku_prompt.visible = False
         yield self.haiku_prompt
         self.status = Static(id="status_display")
@@ -968,69 +1161,82 @@ class NoteApp(App[None]):
 
         self.tabs = self.query_one("#tabs", TabbedContent)
         data = None
-        if TAB_STATE_FILE.exists():
+        if os.path.exists(_TAB_STATE_FILE_STR):
             try:
-                import json
-                with TAB_STATE_FILE.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _json_loads(TAB_STATE_FILE.read_bytes())
             except Exception:
                 data = None
 
         if data and data.get("tabs"):
-            # Recreate tabs as recorded in the state file
+            # Recreate tabs as recorded in the state file.  The highest
+            # numerical tab id is tracked in the same pass so new tabs get
+            # unique IDs without a second walk over the list.
+            records = []
+            max_tab_number = 0
             for info in data["tabs"]:
                 tab_id = info["id"]
+                suffix = tab_id.removeprefix("tab")
+                if suffix.isdigit():
+                    max_tab_number = max(max_tab_number, int(suffix))
                 title = info.get("title", tab_id)
                 # Strip the .txt extension from stored titles for display
                 if title.endswith(".txt"):
                     title = Path(title).stem
                 path_str = info.get("file")
                 path = Path(path_str) if path_str else None
-                text = ""
-                if path and path.exists():
-                    try:
-                        with path.open("r", encoding="utf-8") as f:
-                            text = f.read()
-                    except FileNotFoundError:
-                        pass
-                note_area = NoteEditor(text=text, classes="notes")
-                pane = TabPane(title, note_area, id=tab_id)
-                self.tabs.add_pane(pane)
-                self.file_map[tab_id] = path
-                self.unsaved_map[tab_id] = False
-                self.textareas[tab_id] = note_area
-            # Determine the highest numerical tab id so new tabs get unique IDs
-            self.tab_counter = max(
-                int(info["id"][3:]) for info in data["tabs"] if info["id"].startswith("tab")
-            )
+                records.append((tab_id, title, path))
+            # Read all note files concurrently so startup waits for the
+            # slowest file rather than the sum of them; the widgets are
+            # still built in order so tab layout stays deterministic.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                texts = list(executor.map(_read_note_file, (r[2] for r in records)))
+            # Batch the pane additions so restoring many tabs triggers a
+            # single layout pass instead of one per pane.
+            with self.batch_update():
+                for (tab_id, title, path), text in zip(records, texts):
+                    note_area = NoteEditor(text=text, classes="notes")
+                    pane = TabPane(title, note_area, id=tab_id)
+                    self.tabs.add_pane(pane)
+                    self._register_tab(tab_id, path, note_area, title)
+            # ``or 2`` guards against a state file without any ``tabN`` ids.
+            self.tab_counter = max_tab_number or 2
             active = data.get("active", data["tabs"][0]["id"])
+            self._active_tab = active
             self.tabs.active = active
+            # ``Tabs`` fires its own first-tab activation once the new panes
+            # finish mounting, which lands after ``on_mount`` and would
+            # overwrite the saved selection; re-assert it after the first
+            # refresh so a restored session opens on the right tab.
+            self.call_after_refresh(self._restore_active_tab, active)
         else:
-            # No previous state; load default files
-            for tab_id, path in INITIAL_FILES.items():
-                text = ""
-                if path.exists():
-                    with path.open("r", encoding="utf-8") as f:
-                        text = f.read()
-                note_area = NoteEditor(text=text, classes="notes")
-                pane = TabPane(f"Note {tab_id[-1]}", note_area, id=tab_id)
-                self.tabs.add_pane(pane)
-                self.unsaved_map[tab_id] = False
-                self.file_map[tab_id] = path
-                self.textareas[tab_id] = note_area
+            # No previous state; load the default files, overlapping the
+            # reads for the same reason as the restore branch above.
+            paths = [DATA_DIR / name for _, name in INITIAL_FILES]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                texts = list(executor.map(_read_note_file, paths))
+            with self.batch_update():
+                for (tab_id, _), path, text in zip(INITIAL_FILES, paths, texts):
+                    note_area = NoteEditor(text=text, classes="notes")
+                    title = f"Note {tab_id[-1]}"
+                    pane = TabPane(title, note_area, id=tab_id)
+                    self.tabs.add_pane(pane)
+                    self._register_tab(tab_id, path, note_area, title)
             self.tab_counter = max(
-                int(tid[3:]) for tid in INITIAL_FILES.keys() if tid.startswith("tab")
+                int(suffix)
+                for tid, _ in INITIAL_FILES
+                if (suffix := tid.removeprefix("tab")).isdigit()
             )
+            self._active_tab = "tab1"
             self.tabs.active = "tab1"
 
         # Focus the active tab's text area
-        active = self.tabs.active
-        if active and active in self.textareas:
-            # Focus after mount to avoid "NoMatches" errors
-            self.call_later(self.textareas[active].focus)
+        editor = self._editor(self._active_tab)
+        if editor is not None:
+            # Focus after the initial layout pass so the first paint already
+            # has the right widget focused.
+            self.call_after_refresh(editor.focus)
         self.unsaved = False
         self.update_status()
-        from textual.widgets import Tabs
         self.tab_bar = self.tabs.query_one(Tabs)
         self.tab_bar.visible = True
         # Load quotes from file on startup
@@ -1038,24 +1244,54 @@ class NoteApp(App[None]):
         # Periodic check for experimental modes
         self.set_interval(1, self.check_modes)
 
-    def watch_countdown(self, countdown: CountdownState) -> None:
-        # Update the timer display whenever the countdown changes.
-        self.timer_display.update_time(countdown.remaining)
-        self.timer_display.display = (
-            self.menu_visible or countdown.remaining > 0
-        )
+    def watch_remaining(self, remaining: int) -> None:
+        # Update the timer display whenever the countdown changes.  The
+        # display setter is guarded here and below because assigning it
+        # dirties the compositor even when the value is unchanged.
+        self.timer_display.update_time(remaining)
+        should_display = self.menu_visible or remaining > 0
+        if self.timer_display.display != should_display:
+            self.timer_display.display = should_display
+
+    def watch_menu_visible(self, visible: bool) -> None:
+        # Keep the timer display in sync when the menu opens or closes;
+        # the same rule lives in watch_remaining for countdown changes.
+        should_display = visible or self.remaining > 0
+        if self.timer_display.display != should_display:
+            self.timer_display.display = should_display
 
     def watch_unsaved(self, unsaved: bool) -> None:
         # Update the status bar whenever the save state changes.
         self.update_status()
 
+    def _set_dirty(self, tab_id: str) -> None:
+        # Mark a tab as modified, bumping the dirty count on the
+        # False -> True transition only.
+        record = self._tabs.get(tab_id)
+        if record is not None and not record.unsaved:
+            record.unsaved = True
+            self._dirty_count += 1
+
+    def _clear_dirty(self, tab_id: str) -> None:
+        # Mark a tab as saved, decrementing on the True -> False transition.
+        record = self._tabs.get(tab_id)
+        if record is not None and record.unsaved:
+            record.unsaved = False
+            self._dirty_count -= 1
+
     def watch_tab_bar_visible(self, visible: bool) -> None:
         # Show or hide the tab bar widget without leaving a blank area.
+        # Each watcher returns early when the widget already matches so a
+        # redundant toggle does not trigger a CSS refresh cascade.
+        if self.tab_bar.display == visible:
+            return
         self.tab_bar.display = visible
         self.tab_bar.visible = visible
 
     def watch_open_menu_visible(self, visible: bool) -> None:
         # Display or hide the open-file menu.
+        if self.open_menu.display == visible:
+            return
         self.open_menu.visible = visible
         self.open_menu.display = visible
         if visible:
@@ -1064,21 +1300,29 @@ class NoteApp(App[None]):
 
     def watch_save_menu_visible(self, visible: bool) -> None:
         # Display or hide the save-as menu.
+        if self.save_menu.display == visible:
+            return
         self.save_menu.visible = visible
         self.save_menu.display = visible
 
     def watch_haiku_visible(self, visible: bool) -> None:
         # Show or hide the haiku deletion prompt.
+        if self.haiku_prompt.display == visible:
+            return
         self.haiku_prompt.visible = visible
         self.haiku_prompt.display = visible
 
     def watch_quote_visible(self, visible: bool) -> None:
         # Show or hide the quote overlay.
+        if self.quote_overlay.display == visible:
+            return
         self.quote_overlay.visible = visible
         self.quote_overlay.display = visible
 
     def watch_mode_menu_visible(self, visible: bool) -> None:
         """Show or hide the experimental mode menu."""
+        if self.mode_menu.display == visible:
+            return
         self.mode_menu.visible = visible
         self.mode_menu.display = visible
         if visible:
@@ -1088,12 +1332,20 @@ class NoteApp(App[None]):
     def update_status(self) -> None:
         """Refresh the bottom status bar with mode and save state."""
         state = "Ændringer ikke gemt" if self.unsaved else "Gemt"
+        if self._dirty_count > 1:
+            # More than one tab is dirty; the count is maintained
+            # incrementally so this costs nothing extra.
+            state = f"Ændringer ikke gemt i {self._dirty_count} faner"
+        # Reassigning ``title`` reruns title rendering, so only touch it
+        # when the save state actually moved it.
         if self.unsaved:
             self.status.add_class("modified")
-            self.title = APP_TITLE + "*"
+            title = APP_TITLE + "*"
         else:
             self.status.remove_class("modified")
-            self.title = APP_TITLE
+            title = APP_TITLE
+        if self.title != title:
+            self.title = title
         active_modes = [
             name.replace("_", " ")
             for name, value in self.modes.__dict__.items()
@@ -1112,8 +1364,8 @@ class NoteApp(App[None]):
     def check_modes(self) -> None:
         """Handle timers for the experimental writing modes."""
         now = time.time()
-        active = self.tabs.active or "tab1"
-        editor = self.textareas.get(active)
+        active = self._active_tab
+        editor = self._editor(active)
         if editor is None:
             return
         # Blindstart hides text briefly on startup
@@ -1163,46 +1415,76 @@ class NoteApp(App[None]):
                 self.modes.self_destruct_end = 0.0
                 self.notification.show("Teksten er forsvundet!", duration=5)
 
+    def _schedule_tab_state(self) -> None:
+        """Mark the tab state dirty and schedule a coalesced write.
+
+        Bursts of tab operations (closing several tabs, session restore)
+        collapse into a single disk write half a second later instead of one
+        write per operation.
+        """
+        self._tab_state_dirty = True
+        if self._tab_state_timer is None:
+            self._tab_state_timer = self.set_timer(0.5, self._flush_tab_state)
+
+    def _flush_tab_state(self) -> None:
+        # Perform the pending tab-state write, if any.
+        self._tab_state_timer = None
+        if self._tab_state_dirty:
+            self._tab_state_dirty = False
+            self.save_tab_state()
+
+    def on_unmount(self) -> None:
+        # Flush any pending tab-state write before the app goes away.
+        if self._tab_state_dirty:
+            self._tab_state_dirty = False
+            self.save_tab_state()
+
     def save_tab_state(self) -> None:
         """Write the current open tabs to ``TAB_STATE_FILE``."""
 
-        import json
         data = {
-            "active": self.tabs.active,
+            "active": self._active_tab,
             "tabs": [
                 {
                     "id": tab_id,
-                    "title": self.tabs.get_tab(tab_id).label_text,
-                    "file": str(path) if path else None,
+                    "title": record.title,
+                    "file": str(record.path) if record.path else None,
                 }
-                for tab_id, path in self.file_map.items()
+                for tab_id, record in self._tabs.items()
             ],
         }
-        with TAB_STATE_FILE.open("w", encoding="utf-8") as f:
-            json.dump(data, f)
+        blob = _json_dumps(data)
+        if blob == self._last_tab_state_blob:
+            # Nothing changed since the last write; spare the disk.
+            return
+        # Write to a sibling temp file and rename so a crash mid-write can
+        # never leave a truncated state file, mirroring the note saves.
+        tmp = TAB_STATE_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(blob)
+        os.replace(tmp, TAB_STATE_FILE)
+        self._last_tab_state_blob = blob
 
     def on_key(self, event: events.Key) -> None:
         # Handle global key behaviour and Hemingway restrictions.
-        if event.key in {"ctrl+h", "ctrl+k", "ctrl+m", "ctrl+w"}:
+        if event.key in _SWALLOWED_KEYS:
             # Explicitly swallow these shortcuts so Textual's defaults don't run
             event.stop()
             return
-        if self.hemingway and event.key in {"backspace", "delete", "left"}:
+        if self.hemingway and event.key in _HEMINGWAY_BLOCKED:
             event.prevent_default()
             event.stop()
 
     def action_toggle_menu(self) -> None:
         # Show or hide the timer menu.
         self.menu_visible = not self.menu_visible
-        self.timer_display.display = self.menu_visible or self.countdown.remaining > 0
         if self.menu_visible:
             # Fade the menu in and focus it
             self.menu.show_menu()
         else:
             # Fade the menu out and return focus to the notes
             self.menu.hide_menu()
-            active = self.tabs.active or "tab1"
-            note_area = self.textareas.get(active)
+            active = self._active_tab
+            note_area = self._editor(active)
             if note_area:
                 note_area.focus()
 
@@ -1213,27 +1495,30 @@ class NoteApp(App[None]):
 
     def action_reset_timer(self) -> None:
         # Reset or stop the timer depending on how quickly this action is called.
-        now = time.time()
+        now = time.monotonic()
         # If the timer is running and we pressed reset less than two seconds ago
         # we interpret that as a request to stop the countdown entirely.
-        if (
-            self.countdown.remaining > 0
-            and now - self.countdown.last_started < 2
-        ):
+        if self.remaining > 0 and now - self._last_started < 2:
             self.stop_timer()
             return
-        if self.countdown.duration:
-            self.start_timer(self.countdown.duration)
+        if self._duration:
+            # A freshly started timer is already at full duration; there is
+            # nothing to reset, so skip rebuilding the tick interval.
+            if self.remaining == self._duration and self._tick_handle is not None:
+                return
+            self.start_timer(self._duration)
 
     def action_save_notes(self) -> None:
         """Save the current notes, prompting for a name when needed."""
 
-        now = time.time()
-        active = self.tabs.active or "tab1"
-        textarea = self.textareas.get(active)
-        if textarea is None:
+        # Monotonic so the double-press window survives clock adjustments.
+        now = time.monotonic()
+        active = self._active_tab
+        record = self._tabs.get(active)
+        if record is None:
             return
-        path = self.file_map.get(active)
+        textarea = record.textarea
+        path = record.path
         double = now - self._last_save_time < 2
         self._last_save_time = now
 
@@ -1242,18 +1527,61 @@ class NoteApp(App[None]):
         if path is None or double:
             if not self.save_menu_visible:
                 self.save_menu_visible = True
-                input_widget = self.save_menu.query_one(NoteInput)
+                # Use the reference cached at compose time instead of
+                # walking the DOM on every Ctrl+S.
+                input_widget = self.save_menu._input
                 # Show the file name without extension while editing
                 input_widget.value = path.stem if path else ""
                 input_widget.focus()
             return
 
-        # Write the text to the existing file
-        with path.open("w", encoding="utf-8") as f:
-            f.write(textarea.text)
-        self.unsaved_map[active] = False
-        self.unsaved = False
-        self.notification.show("Noter gemt")
+        # Skip the disk entirely when the buffer matches the last save
+        text = textarea.text
+        if self._saved_hash.get(active) == hash(text):
+            self._clear_dirty(active)
+            self.unsaved = False
+            self.notification.show("Noter gemt")
+            return
+
+        # Write the text in the background so the UI stays responsive
+        self._start_save(path, text, active, "Noter gemt")
+
+    def _start_save(self, path: Path, text: str, tab_id: str, message: str) -> None:
+        # Stamp the save with the tab's next sequence number (on the UI
+        # thread, so numbering is race-free) before handing it to a worker.
+        seq = self._save_seq.get(tab_id, 0) + 1
+        self._save_seq[tab_id] = seq
+        self._persist(path, text, tab_id, message, seq)
+
+    @work(thread=True)
+    def _persist(
+        self, path: Path, text: str, tab_id: str, message: str, seq: int
+    ) -> None:
+        """Write ``text`` to ``path`` atomically off the UI thread.
+
+        Writes are serialized under ``_save_lock`` so overlapping saves of
+        the same note cannot interleave on the temp file, and a save that
+        has been superseded by a newer one for its tab is dropped instead
+        of clobbering the newer content.
+        """
+        with self._save_lock:
+            if seq != self._save_seq.get(tab_id):
+                return
+            _atomic_write_text(path, text)
+        self.call_from_thread(self._mark_saved, tab_id, message, hash(text), seq)
+
+    def _mark_saved(
+        self, tab_id: str, message: str, text_hash: int, seq: int
+    ) -> None:
+        # Bookkeeping on the UI thread once a background save finished.
+        if seq != self._save_seq.get(tab_id):
+            # A newer save of this tab is in flight; let it do the marking.
+            return
+        self._saved_hash[tab_id] = text_hash
+        self._clear_dirty(tab_id)
+        if self._active_tab == tab_id:
+            self.unsaved = False
+        self.notification.show(message)
 
     def action_toggle_hemmingway(self) -> None:
         # Toggle Hemingway mode, which disables deletions and backtracking.
@@ -1263,8 +1591,8 @@ class NoteApp(App[None]):
 
     def action_toggle_focus_sentence(self) -> None:
         """Toggle highlighting of the current sentence."""
-        active = self.tabs.active or "tab1"
-        editor = self.textareas.get(active)
+        active = self._active_tab
+        editor = self._editor(active)
         if editor is None:
             return
         editor.focus_sentence = not editor.focus_sentence
@@ -1277,8 +1605,8 @@ class NoteApp(App[None]):
         """Show or hide the experimental mode menu."""
         self.mode_menu_visible = not self.mode_menu_visible
         if not self.mode_menu_visible:
-            active = self.tabs.active or "tab1"
-            editor = self.textareas.get(active)
+            active = self._active_tab
+            editor = self._editor(active)
             if editor:
                 editor.focus()
 
@@ -1288,47 +1616,89 @@ class NoteApp(App[None]):
 
     def action_prompt_delete(self) -> None:
         """Show the haiku confirmation prompt if a file is attached."""
-        active = self.tabs.active or "tab1"
-        path = self.file_map.get(active)
+        record = self._tabs.get(self._active_tab)
+        path = record.path if record is not None else None
         if path is None:
             self.notification.show("Ingen fil at slette")
             return
         self.haiku_visible = True
         self.haiku_prompt.show_prompt()
 
-    def action_prev_tab(self) -> None:
-        # Activate the previous note tab.
-        tabs = list(self.file_map.keys())
-        active = self.tabs.active or tabs[0]
-        index = tabs.index(active)
-        new_active = tabs[(index - 1) % len(tabs)]
+    def _queue_focus(self, tab_id: str) -> None:
+        """Focus ``tab_id``'s editor after the next refresh, coalescing
+        rapid tab switches into a single focus call."""
+        self._pending_focus = tab_id
+        if not self._focus_scheduled:
+            self._focus_scheduled = True
+            self.call_after_refresh(self._apply_pending_focus)
+
+    def _apply_pending_focus(self) -> None:
+        self._focus_scheduled = False
+        note_area = self._editor(self._pending_focus)
+        if note_area:
+            note_area.focus()
+
+    def _restore_active_tab(self, tab_id: str) -> None:
+        # Re-assert the tab saved in the session state after the restored
+        # panes have mounted and ``Tabs`` has run its default activation.
+        self._active_tab = tab_id
+        if self.tabs.active != tab_id:
+            self.tabs.active = tab_id
+        self._queue_focus(tab_id)
+
+    def _register_tab(
+        self, tab_id: str, path: Optional[Path], textarea: NoteEditor, title: str
+    ) -> None:
+        """Create the record for ``tab_id`` and append it to the order."""
+        self._tabs[tab_id] = TabRecord(path=path, textarea=textarea, title=title)
+        self._tab_index[tab_id] = len(self._tab_order)
+        self._tab_order.append(tab_id)
+
+    def _unregister_tab(self, tab_id: str) -> None:
+        """Drop ``tab_id``'s record and reindex the tabs that followed."""
+        record = self._tabs.pop(tab_id, None)
+        if record is not None and record.unsaved:
+            self._dirty_count -= 1
+        index = self._tab_index.pop(tab_id)
+        self._tab_order.pop(index)
+        for i in range(index, len(self._tab_order)):
+            self._tab_index[self._tab_order[i]] = i
+
+    def _editor(self, tab_id: Optional[str]) -> Optional[NoteEditor]:
+        """Return the editor widget for ``tab_id``, if the tab exists."""
+        record = self._tabs.get(tab_id)
+        return record.textarea if record is not None else None
+
+    def _move_tab(self, delta: int) -> None:
+        # Activate the tab ``delta`` steps from the current one, wrapping.
+        order = self._tab_order
+        index = self._tab_index.get(self._active_tab, 0)
+        new_active = order[(index + delta) % len(order)]
+        self._active_tab = new_active
         self.tabs.active = new_active
 
+    def action_prev_tab(self) -> None:
+        self._move_tab(-1)
+
     def action_next_tab(self) -> None:
-        # Activate the next note tab.
-        tabs = list(self.file_map.keys())
-        active = self.tabs.active or tabs[0]
-        index = tabs.index(active)
-        new_active = tabs[(index + 1) % len(tabs)]
-        self.tabs.active = new_active
+        self._move_tab(1)
 
     def action_new_tab(self) -> None:
         """Create a new empty tab."""
-        from datetime import datetime
         self.tab_counter += 1
         tab_id = f"tab{self.tab_counter}"
         # Name new tabs by creation time without seconds but with day and month
         timestamp = datetime.now().strftime("%H%M-%d%m")
         note_area = NoteEditor(classes="notes")
-        pane = TabPane(f"Note {timestamp}", note_area, id=tab_id)
+        title = f"Note {timestamp}"
+        pane = TabPane(title, note_area, id=tab_id)
         self.tabs.add_pane(pane)
-        self.file_map[tab_id] = None
-        self.unsaved_map[tab_id] = False
-        self.textareas[tab_id] = note_area
+        self._register_tab(tab_id, None, note_area, title)
+        self._active_tab = tab_id
         self.tabs.active = tab_id
         # Focusing the widget instance avoids query errors before it is mounted.
         note_area.focus()
-        self.save_tab_state()
+        self._schedule_tab_state()
 
     def action_open_file(self) -> None:
         """Prompt for a file path to open in a new tab."""
@@ -1347,15 +1717,25 @@ class NoteApp(App[None]):
 
     def on_file_open_menu_open_file(self, message: FileOpenMenu.OpenFile) -> None:
         """Create a new tab from the given file path."""
-        path = Path(message.path)
-        text = ""
+        # Close the menu right away and read the file on a worker thread so
+        # a large note doesn't stall the event loop mid-animation.
+        self.open_menu_visible = False
+        self._load_file_worker(Path(message.path))
+
+    @work(thread=True)
+    def _load_file_worker(self, path: Path) -> None:
+        """Read ``path`` off the UI thread and hand the text back."""
         try:
-            with path.open("r", encoding="utf-8") as f:
-                text = f.read()
+            text = path.read_text(encoding="utf-8")
         except FileNotFoundError:
-            self.notification.show("Filen blev ikke fundet", duration=2)
-            self.open_menu_visible = False
+            self.call_from_thread(
+                self.notification.show, "Filen blev ikke fundet", 2
+            )
             return
+        self.call_from_thread(self._add_file_tab, path, text)
+
+    def _add_file_tab(self, path: Path, text: str) -> None:
+        """Create a new tab for ``path`` with the already-loaded ``text``."""
         self.tab_counter += 1
         tab_id = f"tab{self.tab_counter}"
         # Create the text area separately to focus it after adding the pane.
@@ -1363,46 +1743,44 @@ class NoteApp(App[None]):
         # Use the base file name for the tab label
         pane = TabPane(path.stem, note_area, id=tab_id)
         self.tabs.add_pane(pane)
-        self.file_map[tab_id] = path
-        self.unsaved_map[tab_id] = False
-        self.textareas[tab_id] = note_area
+        self._register_tab(tab_id, path, note_area, path.stem)
+        self._active_tab = tab_id
         self.tabs.active = tab_id
         note_area.focus()
-        self.open_menu_visible = False
-        self.save_tab_state()
+        self._schedule_tab_state()
 
     def on_save_as_menu_save_as(self, message: SaveAsMenu.SaveAs) -> None:
         """Save the active note to the chosen filename."""
-        active = self.tabs.active or "tab1"
+        active = self._active_tab
         path = DATA_DIR / message.path
         # Ensure the extension .txt exists for simplicity
         if path.suffix == "":
             path = path.with_suffix(".txt")
-        textarea = self.textareas.get(active)
+        textarea = self._editor(active)
         if textarea is None:
             return
-        with path.open("w", encoding="utf-8") as f:
-            f.write(textarea.text)
-        self.file_map[active] = path
-        self.unsaved_map[active] = False
-        self.unsaved = False
-        # Update the tab title to match the new filename
+        self._start_save(path, textarea.text, active, f"Gemt som {path.stem}")
+        record = self._tabs[active]
+        record.path = path
+        # Update the tab title (and its cached copy) to match the new filename
+        record.title = path.stem
         self.tabs.get_tab(active).label = path.stem
         self.save_menu_visible = False
-        self.notification.show(f"Gemt som {path.stem}")
-        self.save_tab_state()
+        self._schedule_tab_state()
 
     def on_haiku_prompt_confirm(self, message: HaikuPrompt.Confirm) -> None:
         """Delete the current file after haiku confirmation."""
-        active = self.tabs.active or "tab1"
-        path = self.file_map.get(active)
+        active = self._active_tab
+        record = self._tabs.get(active)
+        path = record.path if record is not None else None
         if path and path.exists():
             try:
                 path.unlink()
             except Exception:
                 pass
-        self.file_map[active] = None
-        self.unsaved_map[active] = False
+        if record is not None:
+            record.path = None
+        self._clear_dirty(active)
         self.unsaved = False
         self.haiku_visible = False
         self.notification.show("Ordene falder. Tomheden vinder.")
@@ -1413,93 +1791,90 @@ class NoteApp(App[None]):
         """Close the currently active tab if more than one is open."""
         if self.tabs.tab_count <= 1:
             return
-        active = self.tabs.active or "tab1"
-        panes = list(self.file_map.keys())
-        index = panes.index(active)
+        active = self._active_tab
+        index = self._tab_index.get(active, 0)
         self.tabs.remove_pane(active)
-        self.unsaved_map.pop(active, None)
-        self.file_map.pop(active, None)
-        self.textareas.pop(active, None)
+        self._unregister_tab(active)
         # Choose which tab becomes active after closing
-        if panes:
-            panes.remove(active)
+        if self._tab_order:
             new_index = index - 1 if index > 0 else 0
-            new_active = panes[new_index]
+            new_active = self._tab_order[new_index]
+            self._active_tab = new_active
             self.tabs.active = new_active
-            note_area = self.textareas.get(new_active)
-            if note_area:
-                note_area.focus()
+            self._queue_focus(new_active)
         self.notification.show("Fane lukket")
-        self.save_tab_state()
+        self._schedule_tab_state()
 
     def close_current_tab(self) -> None:
         """Close the active tab regardless of how many remain."""
-        active = self.tabs.active or "tab1"
-        panes = list(self.file_map.keys())
-        index = panes.index(active)
+        active = self._active_tab
+        index = self._tab_index.get(active, 0)
         self.tabs.remove_pane(active)
-        self.unsaved_map.pop(active, None)
-        self.file_map.pop(active, None)
-        self.textareas.pop(active, None)
-        if panes:
-            panes.remove(active)
-        if panes:
+        self._unregister_tab(active)
+        if self._tab_order:
             new_index = index - 1 if index > 0 else 0
-            new_active = panes[new_index]
+            new_active = self._tab_order[new_index]
+            self._active_tab = new_active
             self.tabs.active = new_active
-            note_area = self.textareas.get(new_active)
-            if note_area:
-                note_area.focus()
+            self._queue_focus(new_active)
         else:
             # If no tabs remain create a new empty one
             self.action_new_tab()
-        self.save_tab_state()
+        self._schedule_tab_state()
 
     def action_toggle_tab_bar(self) -> None:
         """Toggle visibility of the tab bar."""
         self.tab_bar_visible = not self.tab_bar_visible
 
     def start_timer(self, seconds: int) -> None:
-        # Begin counting down from the given number of seconds.
-        self.countdown = CountdownState(
-            duration=seconds,
-            remaining=seconds,
-            last_started=time.time(),
-        )
-        # Cancel any existing timer and create a new one
-        if hasattr(self, "_tick_handle"):
+        # Begin counting down from the given number of seconds.  Assigning
+        # the reactive last lets the watcher show the display with the
+        # right value in one pass.
+        self._duration = seconds
+        self._last_started = time.monotonic()
+        self.remaining = seconds
+        # Cancel any existing timer and create a new one.  Ticking faster
+        # than once a second lets the countdown follow the wall clock even
+        # if individual callbacks are delayed under load.
+        if self._tick_handle is not None:
             self._tick_handle.stop()
-        self._tick_handle = self.set_interval(1, self.tick)
+        self._tick_handle = self.set_interval(0.25, self.tick)
         self.notification.show("Timer startet")
         # Remove any previous blink class in case the timer is restarted
         self.timer_display.remove_class("blink")
 
     def stop_timer(self) -> None:
-        # Stop the timer and hide the display if the menu isn't open.
-        if hasattr(self, "_tick_handle"):
+        # Stop the timer; the watcher resets the display and hides it if
+        # the menu isn't open.
+        if self._tick_handle is not None:
             self._tick_handle.stop()
-        self.countdown.remaining = 0
-        self.timer_display.update_time(0)
-        self.timer_display.display = self.menu_visible
+            self._tick_handle = None
+        self.remaining = 0
         self.timer_display.remove_class("blink")
         self.notification.show("Timer stoppet")
 
     def tick(self) -> None:
-        # Called every second to update the countdown.
-        # Reduce the remaining time and update the display. When the countdown
-        # reaches zero a blink effect is applied and the timer is stopped.
-        if self.countdown.remaining > 0:
-            self.countdown.remaining -= 1
-            self.timer_display.update_time(self.countdown.remaining)
-            if self.countdown.remaining == 0:
-                self.timer_display.add_class("blink")
-                self.notification.show("Tiden er gået!")
-        else:
-            # Once the countdown reaches zero keep showing the timer only if
-            # the menu is visible and stop further updates.
-            self.timer_display.display = self.menu_visible
-            if hasattr(self, "_tick_handle"):
-                self._tick_handle.stop()
+        # Called several times a second to update the countdown.
+        # The remaining time is derived from the wall clock rather than
+        # decremented, so delayed callbacks cannot make the timer drift,
+        # and the reactive is only assigned when the visible second
+        # changes, so the watcher fires at most once a second.
+        if self.remaining <= 0:
+            return
+        remaining = max(
+            0, int(self._duration - (time.monotonic() - self._last_started))
+        )
+        if remaining == self.remaining:
+            return
+        self.remaining = remaining
+        if remaining == 0:
+            # Finish inside this callback instead of burning another
+            # wake-up: stop the interval and flag the expiry; the watcher
+            # already hid the display unless the menu is open.
+            self._tick_handle.stop()
+            self._tick_handle = None
+            self.timer_display.add_class("blink")
+            self.notification.show("Tiden er gået!")
 
     # ------------------------------------------------------------------
     # Quote handling
@@ -1508,16 +1883,41 @@ class NoteApp(App[None]):
     def load_quotes(self) -> None:
         """Load quotes from ``QUOTES_FILE`` if it has changed."""
 
-        if not QUOTES_FILE.exists():
+        # Throttle the freshness check: once the file has been loaded,
+        # re-stat at most once a second instead of on every request.
+        now = time.time()
+        if now - self._last_quote_stat < 1.0 and self._quotes_mtime:
+            return
+        self._last_quote_stat = now
+        # A single stat both detects a missing file and fetches the mtime.
+        try:
+            mtime = os.stat(_QUOTES_FILE_STR).st_mtime
+        except OSError:
             self.quotes = []
+            self._available_quotes = set()
             return
-        mtime = QUOTES_FILE.stat().st_mtime
         if mtime != self._quotes_mtime:
             text = QUOTES_FILE.read_text(encoding="utf-8")
-            self.quotes = [q.strip() for q in text.split("\n\n") if q.strip()]
+            # Build paragraphs line by line instead of splitting on
+            # "\n\n"; that avoids the intermediate fragment list (and a
+            # second strip pass) when the quote file grows large.
+            quotes: list[str] = []
+            buf: list[str] = []
+            for line in text.splitlines():
+                if line.strip():
+                    buf.append(line)
+                elif buf:
+                    quotes.append("\n".join(buf))
+                    buf.clear()
+            if buf:
+                quotes.append("\n".join(buf))
+            self.quotes = quotes
             self._quotes_mtime = mtime
+            # Rebuild the pool of unseen quotes once per file change so
+            # drawing a quote stays O(1) instead of filtering the full list.
+            self._available_quotes = set(self.quotes) - self.shown_quotes
             # If new quotes were added, allow showing quotes again
-            if any(q not in self.shown_quotes for q in self.quotes):
+            if self._available_quotes:
                 self.quotes_finished = False
 
     def action_show_quote(self) -> None:
@@ -1537,16 +1937,16 @@ class NoteApp(App[None]):
         if not self.quotes:
             self.notification.show("Ingen citater fundet")
             return
-        available = [q for q in self.quotes if q not in self.shown_quotes]
-        if not available:
+        if not self._available_quotes:
             if self.quotes_finished:
                 self.notification.show("Citatfilen skal opfyldes igen")
                 return
             self.quote_overlay.show_restart_prompt()
             self.quote_visible = True
             return
-        quote = random.choice(available)
+        quote = random.choice(tuple(self._available_quotes))
         self.shown_quotes.add(quote)
+        self._available_quotes.discard(quote)
         self.quote_overlay.show_quote(quote)
         self.quote_visible = True
 
@@ -1556,6 +1956,7 @@ class NoteApp(App[None]):
         if message.restart:
             # Start over: clear the set and show a new quote
             self.shown_quotes.clear()
+            self._available_quotes = set(self.quotes)
             self.quotes_finished = False
             self.action_show_quote()
         else:
@@ -1570,10 +1971,13 @@ class NoteApp(App[None]):
         self.action_show_quote()
 
     def on_text_area_changed(self, event: NoteEditor.Changed) -> None:  # type: ignore[override]
-        # Mark the current tab as modified when its content changes.
-        active = self.tabs.active or "tab1"
-        self.unsaved_map[active] = True
-        self.unsaved = True
+        # Mark the current tab as modified when its content changes. Both
+        # writes are guarded so a keystroke in an already-dirty buffer does
+        # not re-fire the unsaved watcher (CSS class + title update).
+        active = self._active_tab
+        self._set_dirty(active)
+        if not self.unsaved:
+            self.unsaved = True
         self.register_activity()
         # Track deletions for shadow text
         # ``TextArea``'s ``Changed`` message provides the text area instance in
@@ -1585,17 +1989,19 @@ class NoteApp(App[None]):
             removed = previous[len(current):]
             if removed.strip():
                 shadow = DATA_DIR / f"{active}_shadow.txt"
+                # Group deletions if within a minute of the last deletion,
+                # and append in a single write call.
+                now = time.time()
+                chunk = removed + "\n"
+                if now - self.modes.last_delete_time > 60:
+                    chunk = "\n---\n" + chunk
                 with shadow.open("a", encoding="utf-8") as f:
-                    # Group deletions if within a minute of the last deletion
-                    now = time.time()
-                    if now - self.modes.last_delete_time > 60:
-                        f.write("\n---\n")
-                    f.write(removed + "\n")
-                    self.modes.last_delete_time = now
+                    f.write(chunk)
+                self.modes.last_delete_time = now
         self.prev_text[active] = current
         # Update filler word counts for word shading
         if self.modes.word_shade:
-            editor = self.textareas.get(active)
+            editor = self._editor(active)
             if editor:
                 editor.word_counts = editor.compute_word_counts()
 
@@ -1627,12 +2033,25 @@ class NoteApp(App[None]):
     def on_tabbed_content_tab_activated(self, message: TabbedContent.TabActivated) -> None:
         # Update status when switching tabs.
         active = message.pane.id
-        self.unsaved = self.unsaved_map.get(active, False)
-        note_area = self.textareas.get(active)
-        if note_area:
-            note_area.focus()
+        # Keep the cached active-tab id in sync for every read site.
+        self._active_tab = active
+        # Only assign when the state differs so the watcher (title update
+        # plus CSS class toggle) does not fire on ordinary tab switches.
+        record = self._tabs.get(active)
+        new_state = record.unsaved if record is not None else False
+        if new_state != self.unsaved:
+            self.unsaved = new_state
+        self._queue_focus(active)
 
 
 if __name__ == "__main__":
+    # uvloop lowers the per-callback cost of the asyncio loop Textual
+    # runs on; like orjson above it is optional and Linux/macOS only.
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     app = NoteApp()
     app.run()
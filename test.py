@@ -2,7 +2,7 @@
 # Core structure only using prompt_toolkit
 
 from prompt_toolkit import Application
-from prompt_toolkit.layout import Layout, HSplit, Window
+from prompt_toolkit.layout import Layout, HSplit
 from prompt_toolkit.widgets import TextArea, Frame
 from prompt_toolkit.key_binding import KeyBindings
 import os
@@ -52,12 +52,14 @@ class NotatorApp:
         self.text_area.buffer.insert_text(self.clipboard)
 
     def save_to_file(self):
-        with open(self.filename, 'w') as f:
+        # Large buffer so big notes go out in one write instead of many
+        # page-sized chunks.
+        with open(self.filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(self.text_area.text)
 
     def load_from_file(self, filename):
         if os.path.exists(filename):
-            with open(filename, 'r') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 return f.read()
         return ""
 